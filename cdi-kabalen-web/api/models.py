@@ -14,6 +14,7 @@ class ContentType(str, Enum):
     CARD = "card"
     GALLERY_ITEM = "gallery-item"
     TEXT = "text"
+    FORM = "form"
 
 
 class Section(BaseModel):
@@ -6,9 +6,10 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import re
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 DEFAULT_PAGE_TITLES: Dict[str, str] = {
     "index.html": "Kabalen Toronto – Home",
@@ -28,6 +29,79 @@ NAVIGATION_LINKS: Tuple[Tuple[str, str], ...] = (
     ("contact.html", "Contact"),
 )
 
+ASSET_ROOT = Path(__file__).resolve().parent
+
+EXTERNAL_IMPORT_PATTERN = re.compile(
+    r"""(?:\bfrom|\bimport)\s*\(?\s*["'](https?://[^"']+)["']"""
+)
+
+# Declared (approximate, minified) transfer sizes for third-party modules pulled
+# in by local scripts. Update these when the SDK version in the imports changes.
+EXTERNAL_MODULE_BYTES: Dict[str, int] = {
+    "https://www.gstatic.com/firebasejs/11.1.0/firebase-app.js": 31_000,
+    "https://www.gstatic.com/firebasejs/11.1.0/firebase-analytics.js": 44_000,
+}
+
+SCRIPT_LOADING_MODES = {"defer", "idle"}
+
+
+@dataclass(frozen=True)
+class ScriptSpec:
+    src: str
+    module: bool = False
+    loading: str = "defer"
+
+    def __post_init__(self) -> None:
+        if self.loading not in SCRIPT_LOADING_MODES:
+            raise SystemExit(f"Unknown loading mode '{self.loading}' for script '{self.src}'.")
+
+
+@dataclass
+class ScriptReport:
+    scripts: List[str]
+    local_bytes: int
+    inline_bytes: int
+    external_bytes: int
+    external_modules: List[str]
+
+    @property
+    def total_bytes(self) -> int:
+        return self.local_bytes + self.inline_bytes + self.external_bytes
+
+
+SCRIPT_MANIFEST: Dict[str, ScriptSpec] = {
+    "analytics": ScriptSpec(src="assets/js/firebase-init.js", module=True, loading="idle"),
+    "contact-form": ScriptSpec(src="assets/js/form.js", loading="defer"),
+}
+
+PAGE_SCRIPTS: Dict[str, Tuple[str, ...]] = {
+    "index.html": ("analytics",),
+    "contact.html": ("analytics",),
+}
+
+# Section scripts are included once per page, so section types that bind fixed
+# element ids (``form``) are limited to one section per page; see render_page.
+SECTION_SCRIPTS: Dict[str, Tuple[str, ...]] = {
+    "form": ("contact-form",),
+}
+
+IDLE_LOADER_TEMPLATE = """<script>
+(function () {{
+    var load = function () {{
+        var script = document.createElement("script");
+        {type_line}script.src = "{src}";
+        document.body.appendChild(script);
+    }};
+    window.addEventListener("load", function () {{
+        if ("requestIdleCallback" in window) {{
+            requestIdleCallback(load, {{ timeout: 2000 }});
+        }} else {{
+            setTimeout(load, 1);
+        }}
+    }});
+}})();
+</script>"""
+
 
 @dataclass
 class Section:
@@ -99,6 +173,68 @@ def serialize_sections(sections: Dict[str, List[Section]], json_path: Path) -> N
     json_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
+def resolve_page_scripts(filename: str, sections: Iterable[Section]) -> List[str]:
+    names: List[str] = list(PAGE_SCRIPTS.get(filename.lower(), ()))
+    for section in sections:
+        names.extend(SECTION_SCRIPTS.get(section.content_type, ()))
+
+    resolved: List[str] = []
+    for name in names:
+        if name not in SCRIPT_MANIFEST:
+            raise SystemExit(f"Unknown script '{name}' referenced for {filename}.")
+        if name not in resolved:
+            resolved.append(name)
+    return resolved
+
+
+def render_script_tag(spec: ScriptSpec) -> str:
+    if spec.loading == "idle":
+        type_line = 'script.type = "module";\n        ' if spec.module else ""
+        return IDLE_LOADER_TEMPLATE.format(type_line=type_line, src=spec.src)
+    if spec.module:
+        return f'<script type="module" src="{spec.src}"></script>'
+    return f'<script defer src="{spec.src}"></script>'
+
+
+def render_script_html(script_names: Iterable[str]) -> Tuple[str, str]:
+    specs = [SCRIPT_MANIFEST[name] for name in script_names]
+    preload_html = "".join(
+        f'\n    <link rel="modulepreload" href="{spec.src}">' for spec in specs
+        if spec.module and spec.loading != "idle"
+    )
+    scripts_html = "\n".join(render_script_tag(spec) for spec in specs)
+    return preload_html, scripts_html
+
+
+def measure_script_bytes(script_names: Sequence[str]) -> ScriptReport:
+    local_bytes = 0
+    inline_bytes = 0
+    external_modules: List[str] = []
+    for name in script_names:
+        spec = SCRIPT_MANIFEST[name]
+        source_path = ASSET_ROOT / spec.src
+        if not source_path.exists():
+            raise SystemExit(f"Script '{name}' points at a missing file: {spec.src}")
+        source = source_path.read_text(encoding="utf-8")
+        local_bytes += len(source.encode("utf-8"))
+        for url in EXTERNAL_IMPORT_PATTERN.findall(source):
+            if url not in EXTERNAL_MODULE_BYTES:
+                raise SystemExit(
+                    f"Script '{name}' imports {url}; declare its size in EXTERNAL_MODULE_BYTES."
+                )
+            if url not in external_modules:
+                external_modules.append(url)
+        if spec.loading == "idle":
+            inline_bytes += len(render_script_tag(spec).encode("utf-8"))
+    return ScriptReport(
+        scripts=list(script_names),
+        local_bytes=local_bytes,
+        inline_bytes=inline_bytes,
+        external_bytes=sum(EXTERNAL_MODULE_BYTES[url] for url in external_modules),
+        external_modules=external_modules,
+    )
+
+
 def render_sections_html(sections: Iterable[Section]) -> str:
     rendered: List[str] = []
     for section in sections:
@@ -107,10 +243,15 @@ def render_sections_html(sections: Iterable[Section]) -> str:
     return "\n".join(rendered)
 
 
-def render_page(filename: str, sections: Iterable[Section]) -> str:
+def render_page(
+    filename: str, sections: Iterable[Section], script_names: Optional[Sequence[str]] = None
+) -> str:
     sections_list = list(sections)
     if not sections_list:
         return ""
+    form_count = sum(1 for section in sections_list if section.content_type == "form")
+    if form_count > 1:
+        raise SystemExit(f"{filename} has {form_count} form sections; only one form per page is supported.")
     page_key = filename.lower()
     custom_title = DEFAULT_PAGE_TITLES.get(page_key)
     if not custom_title:
@@ -123,14 +264,16 @@ def render_page(filename: str, sections: Iterable[Section]) -> str:
         f'<a href="{href}">{label}</a>' for href, label in NAVIGATION_LINKS
     )
 
-    firebase_script = '<script type="module" src="assets/js/firebase-init.js"></script>'
+    if script_names is None:
+        script_names = resolve_page_scripts(filename, sections_list)
+    preload_html, scripts_html = render_script_html(script_names)
 
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>{custom_title}</title>
-    <link rel="stylesheet" href="assets/css/style.css">
+    <link rel="stylesheet" href="assets/css/style.css">{preload_html}
 </head>
 <body>
 <header>
@@ -141,7 +284,7 @@ def render_page(filename: str, sections: Iterable[Section]) -> str:
 <footer>
     <p>© 2025 Kabalen Toronto. All rights reserved.</p>
 </footer>
-{firebase_script}
+{scripts_html}
 </body>
 </html>
 """
@@ -221,6 +364,29 @@ def render_text_section(section: Section) -> str:
 """
 
 
+def render_form_section(section: Section) -> str:
+    content_html = f"<p>{section.content}</p>" if section.content else ""
+    return f"""
+<section class="form-section">
+    <h2>{section.title or 'Contact Us'}</h2>
+    {content_html}
+    <form id="contactForm">
+        <label for="name">Name</label>
+        <input type="text" id="name" required>
+
+        <label for="email">Email</label>
+        <input type="email" id="email" required>
+
+        <label for="message">Message</label>
+        <textarea id="message" required></textarea>
+
+        <button type="submit">Send</button>
+    </form>
+    <p id="formStatus"></p>
+</section>
+"""
+
+
 SECTION_RENDERERS = {
     "hero": render_hero_section,
     "callout": render_callout_section,
@@ -228,14 +394,30 @@ SECTION_RENDERERS = {
     "gallery-item": render_gallery_section,
     "gallery": render_gallery_section,
     "text": render_text_section,
+    "form": render_form_section,
 }
 
 
-def build_html_pages(sections: Dict[str, List[Section]], output_dir: Path) -> None:
+def build_html_pages(sections: Dict[str, List[Section]], output_dir: Path) -> Dict[str, ScriptReport]:
     output_dir.mkdir(parents=True, exist_ok=True)
+    script_report: Dict[str, ScriptReport] = {}
     for filename, section_list in sections.items():
-        html = render_page(filename, section_list)
+        script_names = resolve_page_scripts(filename, section_list)
+        html = render_page(filename, section_list, script_names)
         (output_dir / filename).write_text(html, encoding="utf-8")
+        script_report[filename] = measure_script_bytes(script_names)
+    return script_report
+
+
+def print_script_report(script_report: Dict[str, ScriptReport]) -> None:
+    print("JavaScript per page (local + inline + declared third-party bytes):")
+    for filename, entry in sorted(script_report.items()):
+        scripts = ", ".join(entry.scripts) or "none"
+        print(
+            f"  {filename}: {entry.total_bytes} bytes [{scripts}]"
+            f" ({entry.local_bytes + entry.inline_bytes} local,"
+            f" ~{entry.external_bytes} across {len(entry.external_modules)} third-party module(s))"
+        )
 
 
 def parse_args() -> argparse.Namespace:
@@ -260,7 +442,7 @@ def main() -> None:
 
     serialize_sections(sections, args.json)
     if not args.no_html:
-        build_html_pages(sections, args.output)
+        print_script_report(build_html_pages(sections, args.output))
 
 
 if __name__ == "__main__":